@@ -3,18 +3,10 @@
 S3Drop Examples - Using S3Drop programmatically.
 """
 
-import subprocess
+import os
 import sys
-from pathlib import Path
 
-
-def run_command(command):
-    """Run a shell command and return the result."""
-    try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
-        return result.returncode == 0, result.stdout, result.stderr
-    except Exception as e:
-        return False, "", str(e)
+from s3drop import drop, drop_many, get_drop_zone, iter_keys, parse_expiration, share
 
 
 def drop_and_share_simple(drop_zone, file_path):
@@ -28,17 +20,10 @@ def drop_and_share_simple(drop_zone, file_path):
     Returns:
         str: Share URL or None if failed
     """
-    command = f"python3 s3drop.py {drop_zone} drop '{file_path}' --share"
-    success, stdout, stderr = run_command(command)
-    
-    if success:
-        # Extract URL from output (this is a simple example)
-        lines = stdout.split('\n')
-        for line in lines:
-            if line.startswith('https://'):
-                return line.strip()
-    else:
-        print(f"Error: {stderr}")
+    try:
+        return drop(drop_zone, file_path, share=True)['url']
+    except Exception as e:
+        print(f"Error: {e}")
     
     return None
 
@@ -55,16 +40,10 @@ def drop_with_expiration(drop_zone, file_path, expires='48h'):
     Returns:
         str: Share URL or None if failed
     """
-    command = f"python3 s3drop.py {drop_zone} drop '{file_path}' --share --expires {expires}"
-    success, stdout, stderr = run_command(command)
-    
-    if success:
-        lines = stdout.split('\n')
-        for line in lines:
-            if line.startswith('https://'):
-                return line.strip()
-    else:
-        print(f"Error: {stderr}")
+    try:
+        return drop(drop_zone, file_path, share=True, expires=expires)['url']
+    except Exception as e:
+        print(f"Error: {e}")
     
     return None
 
@@ -80,16 +59,10 @@ def drop_with_short_url(drop_zone, file_path, service='tinyurl'):
     Returns:
         str: Shortened share URL or None if failed
     """
-    command = f"python3 s3drop.py {drop_zone} drop '{file_path}' --share --short --short-service {service}"
-    success, stdout, stderr = run_command(command)
-    
-    if success:
-        lines = stdout.split('\n')
-        for line in lines:
-            if line.startswith('https://'):
-                return line.strip()
-    else:
-        print(f"Error: {stderr}")
+    try:
+        return drop(drop_zone, file_path, share=True, short=service)['url']
+    except Exception as e:
+        print(f"Error: {e}")
     
     return None
 
@@ -106,16 +79,10 @@ def get_share_link(drop_zone, s3_key, expires='24h'):
     Returns:
         str: Share URL or None if failed
     """
-    command = f"python3 s3drop.py {drop_zone} share '{s3_key}' --expires {expires}"
-    success, stdout, stderr = run_command(command)
-    
-    if success:
-        lines = stdout.split('\n')
-        for line in lines:
-            if line.startswith('https://'):
-                return line.strip()
-    else:
-        print(f"Error: {stderr}")
+    try:
+        return share(drop_zone, s3_key, expires=expires)['url']
+    except Exception as e:
+        print(f"Error: {e}")
     
     return None
 
@@ -124,34 +91,28 @@ def list_drop_zone_files(drop_zone):
     """
     Example: List all files in the drop zone.
     
+    Keys are yielded page by page as S3 returns them, so large drop zones
+    don't have to be listed in full before the first result is available.
+    
     Args:
         drop_zone (str): Your S3Drop zone name
     
-    Returns:
-        list: List of file names or empty list if failed
+    Yields:
+        str: File names in the drop zone
     """
-    command = f"python3 s3drop.py {drop_zone} list"
-    success, stdout, stderr = run_command(command)
-    
-    if success:
-        files = []
-        lines = stdout.split('\n')
-        for line in lines:
-            if line.strip().startswith('📄'):
-                # Extract filename from the formatted output
-                filename = line.split('📄')[1].strip().split()[0]
-                files.append(filename)
-        return files
-    else:
-        print(f"Error: {stderr}")
-    
-    return []
+    try:
+        yield from iter_keys(drop_zone)
+    except Exception as e:
+        print(f"Error: {e}")
 
 
 def batch_drop_files(drop_zone, file_paths, expires='24h'):
     """
     Example: Drop multiple files at once.
     
+    Files are uploaded concurrently by S3Drop over a single shared S3 client
+    instead of starting a new process per file.
+    
     Args:
         drop_zone (str): Your S3Drop zone name
         file_paths (list): List of file paths to drop
@@ -162,19 +123,41 @@ def batch_drop_files(drop_zone, file_paths, expires='24h'):
     """
     results = {}
     
-    for file_path in file_paths:
-        print(f"Dropping: {file_path}")
-        url = drop_with_expiration(drop_zone, file_path, expires)
-        results[file_path] = url
+    for result in drop_many(drop_zone, file_paths, share=True, expires=expires):
+        file_path = result['path']
+        results[file_path] = result.get('url')
         
-        if url:
-            print(f"✅ Success: {Path(file_path).name}")
+        if result['ok']:
+            print(f"✅ Success: {os.path.basename(file_path)}")
         else:
-            print(f"❌ Failed: {Path(file_path).name}")
+            print(f"Error: {result['error']}")
+            print(f"❌ Failed: {os.path.basename(file_path)}")
     
     return results
 
 
+def batch_share(drop_zone, s3_keys, expires='24h'):
+    """
+    Example: Generate share links for multiple existing files at once.
+    
+    Args:
+        drop_zone (str): Your S3Drop zone name
+        s3_keys (list): S3 object keys (filenames in drop zone)
+        expires (str): Expiration time for share links
+    
+    Returns:
+        dict: Dictionary mapping S3 keys to share URLs
+    """
+    try:
+        s3drop = get_drop_zone(drop_zone)
+        links = s3drop.generate_share_links(s3_keys, parse_expiration(expires), verify_exist=True)
+    except Exception as e:
+        print(f"Error: {e}")
+        return {s3_key: None for s3_key in s3_keys}
+    
+    return {s3_key: link[0] if link else None for s3_key, link in links.items()}
+
+
 def main():
     """Example usage of the functions above."""
     # Configuration
@@ -188,7 +171,7 @@ def main():
     test_file = "example.txt"
     
     # Create a test file if it doesn't exist
-    if not Path(test_file).exists():
+    if not os.path.exists(test_file):
         with open(test_file, 'w') as f:
             f.write("This is a test file for S3Drop.")
         print(f"Created test file: {test_file}")
@@ -221,7 +204,7 @@ def main():
     
     # Example 4: List files
     print("\n📁 Example 4: List drop zone files")
-    files = list_drop_zone_files(DROP_ZONE)
+    files = list(list_drop_zone_files(DROP_ZONE))
     if files:
         print("Files in drop zone:")
         for file in files:
@@ -237,11 +220,18 @@ def main():
     print("\nBatch dropping results:")
     for file_path, url in results.items():
         status = "✅" if url else "❌"
-        print(f"{status} {Path(file_path).name}: {url or 'Failed'}")
+        print(f"{status} {os.path.basename(file_path)}: {url or 'Failed'}")
+    
+    # Example 6: Batch sharing
+    print("\n🔗 Example 6: Batch share links for existing files")
+    results = batch_share(DROP_ZONE, [os.path.basename(f) for f in test_files], '24h')
+    for s3_key, url in results.items():
+        status = "✅" if url else "❌"
+        print(f"{status} {s3_key}: {url or 'Failed'}")
     
     # Clean up test file
-    if Path(test_file).exists():
-        Path(test_file).unlink()
+    if os.path.exists(test_file):
+        os.remove(test_file)
         print(f"\nCleaned up test file: {test_file}")
 
 
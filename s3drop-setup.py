@@ -3,10 +3,62 @@
 S3Drop Setup - Create a secure S3 bucket for file dropping.
 """
 
-import boto3
+import functools
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+# S3 clients by region, reused across calls
+_CLIENTS = {}
+
+# Drop zone settings, shared by every create_drop_zone call
+_PAB_CONF = {
+    'BlockPublicAcls': True,
+    'IgnorePublicAcls': True,
+    'BlockPublicPolicy': True,
+    'RestrictPublicBuckets': True
+}
+_VERSIONING_ENABLED = {'Status': 'Enabled'}
+
+# S3 bucket naming rules: 3-63 lowercase letters, numbers, hyphens and
+# periods, starting and ending with a letter or number, with no two periods
+# in a row and not formatted as an IP address
+_BUCKET_RE = re.compile(
+    r'(?!.*\.\.)(?!\d{1,3}(?:\.\d{1,3}){3}$)'
+    r'[a-z0-9][a-z0-9.\-]{1,61}[a-z0-9]'
+)
+
+
+def is_valid_drop_zone_name(bucket_name):
+    """Check a drop zone name against the S3 bucket naming rules."""
+    return _BUCKET_RE.fullmatch(bucket_name) is not None
+
+
+def _client(region):
+    """Get a pooled keep-alive S3 client for a region, creating it on first use."""
+    client = _CLIENTS.get(region)
+    if client is None:
+        # Keep connections alive so the follow-up bucket configuration
+        # calls reuse the same TCP/TLS session
+        config = Config(
+            max_pool_connections=50,
+            tcp_keepalive=True,
+            retries={'mode': 'standard', 'max_attempts': 5}
+        )
+        client = boto3.client('s3', region_name=region, config=config)
+        _CLIENTS[region] = client
+    return client
+
+
+@functools.lru_cache(maxsize=None)
+def _account_id():
+    """Get the AWS account ID that the current credentials belong to."""
+    return boto3.client('sts').get_caller_identity()['Account']
+
 
 def create_drop_zone(bucket_name, region='us-east-1'):
     """
@@ -20,40 +72,65 @@ def create_drop_zone(bucket_name, region='us-east-1'):
         bool: True if successful, False otherwise
     """
     try:
-        s3_client = boto3.client('s3', region_name=region)
+        s3_client = _client(region)
+        owner = _account_id()
         
-        print(f"🪣 Creating S3Drop zone: {bucket_name}")
-        print(f"📍 Region: {region}")
+        # A HEAD request is much cheaper than a failed create, so re-running
+        # setup on an existing drop zone only re-applies its settings.
+        # ExpectedBucketOwner makes S3 answer 403 for buckets in other
+        # accounts, so those are never modified.
+        try:
+            response = s3_client.head_bucket(Bucket=bucket_name, ExpectedBucketOwner=owner)
+            exists = True
+        except ClientError as e:
+            if e.response['Error']['Code'] != '404':
+                raise
+            exists = False
         
-        # Create bucket
-        if region == 'us-east-1':
-            s3_client.create_bucket(Bucket=bucket_name)
+        if exists:
+            # The existing bucket may live in a different region
+            headers = response['ResponseMetadata']['HTTPHeaders']
+            region = headers.get('x-amz-bucket-region', region)
+            s3_client = _client(region)
+            print(f"ℹ️ Drop zone '{bucket_name}' already exists and is owned by you")
         else:
-            s3_client.create_bucket(
-                Bucket=bucket_name,
-                CreateBucketConfiguration={'LocationConstraint': region}
-            )
+            print(f"🪣 Creating S3Drop zone: {bucket_name}")
+            print(f"📍 Region: {region}")
+            
+            # Create bucket
+            if region == 'us-east-1':
+                s3_client.create_bucket(Bucket=bucket_name)
+            else:
+                s3_client.create_bucket(
+                    Bucket=bucket_name,
+                    CreateBucketConfiguration={'LocationConstraint': region}
+                )
         
-        # Block all public access (security best practice)
+        # Block all public access (security best practice) and enable
+        # versioning (recommended). The two calls are independent, so they
+        # are issued in parallel.
         print("🔒 Securing your drop zone...")
-        s3_client.put_public_access_block(
-            Bucket=bucket_name,
-            PublicAccessBlockConfiguration={
-                'BlockPublicAcls': True,
-                'IgnorePublicAcls': True,
-                'BlockPublicPolicy': True,
-                'RestrictPublicBuckets': True
-            }
-        )
-        
-        # Enable versioning (recommended)
         print("📝 Enabling file versioning...")
-        s3_client.put_bucket_versioning(
-            Bucket=bucket_name,
-            VersioningConfiguration={'Status': 'Enabled'}
-        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            public_access = executor.submit(
+                s3_client.put_public_access_block,
+                Bucket=bucket_name,
+                PublicAccessBlockConfiguration=_PAB_CONF,
+                ExpectedBucketOwner=owner
+            )
+            versioning = executor.submit(
+                s3_client.put_bucket_versioning,
+                Bucket=bucket_name,
+                VersioningConfiguration=_VERSIONING_ENABLED,
+                ExpectedBucketOwner=owner
+            )
+            public_access.result()
+            versioning.result()
         
-        print(f"✅ Drop zone '{bucket_name}' created successfully!")
+        if exists:
+            print(f"✅ Drop zone '{bucket_name}' is up to date!")
+        else:
+            print(f"✅ Drop zone '{bucket_name}' created successfully!")
         print(f"🔐 Your drop zone is private and secure")
         print(f"📍 Region: {region}")
         
@@ -68,6 +145,9 @@ def create_drop_zone(bucket_name, region='us-east-1'):
         elif error_code == 'BucketAlreadyOwnedByYou':
             print(f"ℹ️ Drop zone '{bucket_name}' already exists and is owned by you")
             return True
+        elif error_code == '403':
+            print(f"❌ Drop zone '{bucket_name}' exists but isn't owned by your AWS account")
+            print("💡 Try a different bucket name (must be globally unique)")
         else:
             print(f"❌ Error creating drop zone: {e}")
         return False
@@ -107,12 +187,9 @@ def main():
         sys.exit(1)
     
     # Validate bucket name
-    if not bucket_name.replace('-', '').replace('.', '').isalnum():
-        print("❌ Drop zone name can only contain letters, numbers, hyphens, and periods")
-        sys.exit(1)
-    
-    if len(bucket_name) < 3 or len(bucket_name) > 63:
-        print("❌ Drop zone name must be between 3 and 63 characters")
+    if not is_valid_drop_zone_name(bucket_name):
+        print("❌ Drop zone name must be 3-63 characters of lowercase letters, numbers, hyphens, and periods")
+        print("💡 It must start and end with a letter or number, have no '..', and not look like an IP address")
         sys.exit(1)
     
     # Get region
@@ -9,52 +9,548 @@ Website: https://github.com/your-username/s3drop
 """
 
 import argparse
+import functools
+import json
 import os
+import queue
+import sqlite3
 import sys
-from datetime import datetime, timedelta
-import urllib.parse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from datetime import datetime
 
-import boto3
-import requests
-from botocore.config import Config
-from botocore.exceptions import ClientError, NoCredentialsError
+# boto3 and requests are imported where they're used, so --help, --version
+# and setup don't pay for loading them
 
 __version__ = "1.0.0"
 
+# Share links for the same file and expiry are reused for this many seconds
+# instead of being signed again
+PRESIGN_CACHE_SECONDS = 300
+
+# Single uploads: files from this size up are split into parts that are sent
+# concurrently over the shared client
+UPLOAD_MULTIPART_THRESHOLD = 64 * 1024 * 1024
+
+# Batch uploads: one transfer manager per batch splits large files into parts
+# and caps the requests in flight across all files at max_concurrency, which
+# stays below the client's connection pool size (TransferConfig arguments)
+BATCH_TRANSFER_SETTINGS = {
+    'multipart_threshold': 8 * 1024 * 1024,
+    'multipart_chunksize': 8 * 1024 * 1024,
+    'max_concurrency': 20,
+    'use_threads': True,
+}
+
+# URL shorteners get a short timeout: if they're unreachable we fall back to
+# the full link instead of hanging the upload
+SHORTEN_TIMEOUT = 1.0
+
+# Timestamp format for file listings
+LIST_TIME_FORMAT = '%Y-%m-%d %H:%M'
+
+# Listings longer than this are printed one tab-separated line per file
+LIST_COMPACT_THRESHOLD = 500
+
+# Top-level folders are only listed concurrently when there are at most this
+# many; past that, a request per folder costs more than paginating once
+LIST_FANOUT_MAX_PREFIXES = 32
+
+# On-disk cache, so share links are also reused across CLI invocations
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 's3drop')
+URL_CACHE_PATH = os.path.join(CACHE_DIR, 'urls.db')
+
+# Bucket regions found by lookup, so later runs can skip GetBucketLocation
+REGION_CACHE_PATH = os.path.join(CACHE_DIR, 'regions.json')
+
+
+_url_db = None
+_url_db_lock = threading.Lock()
+
+
+def _url_cache():
+    """Open the on-disk share link cache once per process; None if unavailable."""
+    global _url_db
+    if _url_db is None:
+        try:
+            # Share links are bearer credentials, so keep them owner-only
+            os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+            os.chmod(CACHE_DIR, 0o700)
+            os.close(os.open(URL_CACHE_PATH, os.O_CREAT | os.O_RDWR, 0o600))
+            os.chmod(URL_CACHE_PATH, 0o600)
+            
+            db = sqlite3.connect(URL_CACHE_PATH, timeout=1, check_same_thread=False)
+            db.execute('PRAGMA synchronous = OFF')  # A lost entry only costs a re-sign
+            db.execute('CREATE TABLE IF NOT EXISTS urls (k TEXT PRIMARY KEY, url TEXT, exp INTEGER)')
+            with db:
+                db.execute('DELETE FROM urls WHERE exp < ?', (int(time.time()),))
+            _url_db = db
+        except (OSError, sqlite3.Error):
+            _url_db = False  # Caching is best effort; don't retry
+    return _url_db or None
+
+
+def _load_share_links(cache_keys, min_expiry):
+    """Return {cache_key: (url, expiry)} for cached links expiring no earlier than min_expiry."""
+    found = {}
+    with _url_db_lock:
+        db = _url_cache()
+        if db is None:
+            return found
+        try:
+            # Stay well below SQLite's limit on query parameters
+            for i in range(0, len(cache_keys), 500):
+                batch = cache_keys[i:i + 500]
+                rows = db.execute(
+                    f"SELECT k, url, exp FROM urls WHERE exp >= ? AND k IN ({', '.join('?' * len(batch))})",
+                    [min_expiry] + batch
+                )
+                for cache_key, url, expiry in rows:
+                    found[cache_key] = url, datetime.fromtimestamp(expiry)
+        except sqlite3.Error:
+            pass
+    return found
+
+
+def _load_share_link(cache_key, min_expiry):
+    """Return a cached (url, expiry) expiring no earlier than min_expiry, or None."""
+    return _load_share_links([cache_key], min_expiry).get(cache_key)
+
+
+def _store_share_links(rows):
+    """Save (cache_key, url, expiry) rows to the on-disk cache in one transaction."""
+    with _url_db_lock:
+        db = _url_cache()
+        if db is None:
+            return
+        try:
+            with db:
+                db.executemany('INSERT OR REPLACE INTO urls VALUES (?, ?, ?)', rows)
+        except sqlite3.Error:
+            pass  # Caching is best effort
+
+
+def _store_share_link(cache_key, url, expiry):
+    """Save a share link to the on-disk cache."""
+    _store_share_links([(cache_key, url, expiry)])
+
+
+def _format_mb(size):
+    """Format a size in bytes as megabytes with two decimals, using integer math."""
+    hundredths = (size * 100 + (1 << 19)) >> 20  # Rounded to the nearest 0.01 MB
+    return f"{hundredths // 100}.{hundredths % 100:02d}"
+
+
+_write_lock = threading.Lock()
+
+
+def _write_at(fd, data, offset):
+    """Write data to fd at offset without moving a shared file position."""
+    if hasattr(os, 'pwrite'):
+        written = 0
+        view = memoryview(data)
+        while written < len(view):
+            written += os.pwrite(fd, view[written:], offset + written)
+        return written
+    
+    # No pwrite (Windows): serialize seek + write
+    with _write_lock:
+        os.lseek(fd, offset, os.SEEK_SET)
+        written = 0
+        view = memoryview(data)
+        while written < len(view):
+            written += os.write(fd, view[written:])
+        return written
+
+
+@functools.lru_cache(maxsize=None)
+def _checksum_algorithm():
+    """
+    Checksum S3 verifies on every upload: CRC32C when awscrt is installed to
+    compute it in native code, otherwise CRC32, which botocore has built in.
+    """
+    from botocore.compat import HAS_CRT
+    
+    return 'CRC32C' if HAS_CRT else 'CRC32'
+
+
+def _load_regions():
+    """Read the bucket region cache; empty if missing or unreadable."""
+    try:
+        with open(REGION_CACHE_PATH) as f:
+            regions = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return regions if isinstance(regions, dict) else {}
+
+
+def _store_region(bucket_name, region):
+    """Remember a bucket's region in the on-disk cache."""
+    regions = _load_regions()
+    if regions.get(bucket_name) != region:
+        regions[bucket_name] = region
+        _write_regions(regions)
+
+
+def _forget_region(bucket_name):
+    """Drop a bucket from the region cache, e.g. because it was deleted."""
+    regions = _load_regions()
+    if regions.pop(bucket_name, None) is not None:
+        _write_regions(regions)
+
+
+def _write_regions(regions):
+    """Replace the bucket region cache."""
+    try:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        # Write then rename, so a concurrent run never reads half a file
+        tmp_path = f"{REGION_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(regions, f)
+        os.replace(tmp_path, REGION_CACHE_PATH)
+    except OSError:
+        pass  # Caching is best effort
+
+
+def _share_link_cache_key(signer_id, bucket_name, s3_key, expiration_seconds, check_exists):
+    """Key a share link is stored under in the on-disk cache."""
+    cache_key = f"{signer_id}|{bucket_name}|{s3_key}|{expiration_seconds}"
+    if not check_exists:
+        # Kept apart, so a link signed without checking the object is never
+        # handed out where a checked one was asked for
+        cache_key += '|unchecked'
+    return cache_key
+
+
+def _presign(client, signer_id, bucket_name, s3_key, expiration_seconds, check_exists=True):
+    """
+    Get a presigned download URL, reusing one issued in the current cache window.
+    
+    Args:
+        client: S3 client used for signing
+        signer_id (str): Identity of the signing credentials, so links signed
+            by one profile are never handed out for another
+        bucket_name (str): Name of the S3 bucket
+        s3_key (str): S3 object key
+        expiration_seconds (int): Seconds until the URL expires
+        check_exists (bool): Confirm the object exists before signing
+    
+    Returns:
+        tuple: (share_url, expiry_datetime)
+    """
+    window = int(time.time() // PRESIGN_CACHE_SECONDS)
+    return _presign_in_window(
+        client, signer_id, bucket_name, s3_key, expiration_seconds, check_exists, window
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _presign_in_window(client, signer_id, bucket_name, s3_key, expiration_seconds,
+                       check_exists, window):
+    """
+    Generate a presigned download URL, memoized per cache window.
+    
+    Links issued within the last PRESIGN_CACHE_SECONDS are served from memory
+    or from the on-disk cache before checking the object and signing a new
+    one, so cache hits make no network calls.
+    """
+    cache_key = _share_link_cache_key(signer_id, bucket_name, s3_key, expiration_seconds, check_exists)
+    now = int(time.time())
+    
+    cached = _load_share_link(cache_key, now + expiration_seconds - PRESIGN_CACHE_SECONDS)
+    if cached:
+        return cached
+    
+    if check_exists:
+        client.head_object(Bucket=bucket_name, Key=s3_key)
+    
+    url = client.generate_presigned_url(
+        'get_object',
+        Params={'Bucket': bucket_name, 'Key': s3_key},
+        ExpiresIn=expiration_seconds
+    )
+    expiry = now + expiration_seconds
+    _store_share_link(cache_key, url, expiry)
+    return url, datetime.fromtimestamp(expiry)
+
+
+def _presign_many(client, signer_id, bucket_name, s3_keys, expiration_seconds):
+    """
+    Get presigned download URLs for several keys without checking they exist.
+    
+    Like _presign, links issued within the last PRESIGN_CACHE_SECONDS are
+    reused, but the on-disk cache is read with one query and written in one
+    transaction for the whole batch, leaving signing as the per-key cost.
+    
+    Returns:
+        dict: S3 key to (share_url, expiry_datetime)
+    """
+    now = int(time.time())
+    cache_keys = {
+        s3_key: _share_link_cache_key(signer_id, bucket_name, s3_key, expiration_seconds, False)
+        for s3_key in s3_keys
+    }
+    cached = _load_share_links(list(cache_keys.values()), now + expiration_seconds - PRESIGN_CACHE_SECONDS)
+    
+    links, fresh = {}, []
+    # Every link signed now expires at the same moment, so share one datetime
+    expiry = now + expiration_seconds
+    expires_at = datetime.fromtimestamp(expiry)
+    for s3_key, cache_key in cache_keys.items():
+        if cache_key in cached:
+            links[s3_key] = cached[cache_key]
+            continue
+        url = client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': bucket_name, 'Key': s3_key},
+            ExpiresIn=expiration_seconds
+        )
+        links[s3_key] = url, expires_at
+        fresh.append((cache_key, url, expiry))
+    
+    _store_share_links(fresh)
+    return links
+
+
+@functools.lru_cache(maxsize=None)
+def _http():
+    """
+    One keep-alive session for link checks, so repeated requests reuse the
+    TCP/TLS connection. Dropped connections are retried, but a host that
+    can't be reached at all isn't.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10, pool_maxsize=20,
+        max_retries=Retry(total=3, connect=0, backoff_factor=0.3)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def _shortener_pool():
+    """
+    Connection pool for the shortener APIs. These are plain form requests, so
+    urllib3 is used directly without requests' session and hook machinery.
+    """
+    import urllib3
+    from urllib3.util.retry import Retry
+    
+    # No connect or read retries: a service that is down or stalls has to
+    # fail within SHORTEN_TIMEOUT so the full link is used instead
+    return urllib3.PoolManager(
+        num_pools=4, maxsize=10,
+        retries=Retry(total=3, connect=0, read=0, backoff_factor=0.2),
+        timeout=urllib3.Timeout(total=SHORTEN_TIMEOUT)
+    )
+
+
+def _shortener_request(method, api_url, fields, session=None):
+    """
+    Call a shortener API and return the response body as text. Requests go
+    through session (a requests.Session) when one is given, otherwise
+    through the shared urllib3 pool.
+    """
+    if session is not None:
+        field_arg = 'params' if method == 'GET' else 'data'
+        response = session.request(method, api_url, timeout=SHORTEN_TIMEOUT, **{field_arg: fields})
+        if response.status_code >= 400:
+            raise Exception(f"HTTP {response.status_code} from {api_url}")
+        return response.text.strip()
+    
+    # Form bodies are sent URL-encoded, as the APIs expect, not as multipart
+    body_options = {'encode_multipart': False} if method == 'POST' else {}
+    response = _shortener_pool().request(
+        method, api_url, fields=fields, **body_options
+    )
+    if response.status >= 400:
+        raise Exception(f"HTTP {response.status} from {api_url}")
+    return response.data.decode('utf-8').strip()
+
+
+def _shorten_with_tinyurl(long_url, session=None):
+    """Shorten URL using TinyURL API."""
+    api_url = "http://tinyurl.com/api-create.php"
+    short_url = _shortener_request('GET', api_url, {'url': long_url}, session)
+    
+    if short_url.startswith('http'):
+        return short_url
+    else:
+        raise Exception(f"TinyURL error: {short_url}")
+
+
+def _shorten_with_isgd(long_url, session=None):
+    """Shorten URL using is.gd API."""
+    api_url = "https://is.gd/create.php"
+    short_url = _shortener_request('GET', api_url, {'format': 'simple', 'url': long_url}, session)
+    
+    if short_url.startswith('http'):
+        return short_url
+    else:
+        raise Exception(f"is.gd error: {short_url}")
+
+
+def _shorten_with_vgd(long_url, session=None):
+    """Shorten URL using v.gd API."""
+    api_url = "https://v.gd/create.php"
+    short_url = _shortener_request('GET', api_url, {'format': 'simple', 'url': long_url}, session)
+    
+    if short_url.startswith('http'):
+        return short_url
+    else:
+        raise Exception(f"v.gd error: {short_url}")
+
+
+def _shorten_with_1ptco(long_url, session=None):
+    """Shorten URL using 1pt.co API."""
+    api_url = "https://1pt.co/addURL"
+    result = json.loads(_shortener_request('POST', api_url, {'long': long_url}, session))
+    
+    if result.get('status') == 'success':
+        short_url = result.get('short')
+        if short_url:
+            return short_url
+    
+    raise Exception(f"1pt.co error: {result.get('msg', 'Unknown error')}")
+
+
+_SHORTENERS = {
+    'tinyurl': _shorten_with_tinyurl,
+    'isgd': _shorten_with_isgd,
+    'vgd': _shorten_with_vgd,
+    '1ptco': _shorten_with_1ptco,
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _shorten(long_url, service, session=None):
+    """Shorten long_url with the given service; only successes are cached."""
+    return _SHORTENERS[service](long_url, session)
+
+
+class ProgressTracker:
+    """
+    Upload progress callback for boto3 transfers.
+    
+    Transfers call it from several threads with the bytes sent since the last
+    call; progress is printed at most every PROGRESS_INTERVAL seconds.
+    """
+    
+    PROGRESS_INTERVAL = 0.5
+    
+    def __init__(self, total_bytes):
+        self._total = total_bytes
+        self._seen = 0
+        self._started = time.monotonic()
+        self._last_print = self._started
+        self._printed = False
+        self._lock = threading.Lock()
+        # Redraw one line on a terminal, print one line per update otherwise
+        self._end = '\r' if sys.stdout.isatty() else '\n'
+    
+    def __call__(self, bytes_transferred):
+        with self._lock:
+            self._seen += bytes_transferred
+            now = time.monotonic()
+            if now - self._last_print < self.PROGRESS_INTERVAL:
+                return
+            self._last_print = now
+            
+            percent = self._seen * 100 // self._total if self._total else 100
+            rate = (self._seen >> 20) / (now - self._started)
+            print(f"   {percent}% ({_format_mb(self._seen)} of {_format_mb(self._total)} MB) "
+                  f"at {rate:.1f} MB/s", end=self._end, flush=True)
+            self._printed = True
+    
+    def finish(self):
+        """End the progress line, if one was drawn."""
+        if self._printed and self._end == '\r':
+            print()
+
+
+class S3DropError(Exception):
+    """Raised when a drop zone can't be used; details have already been printed."""
+
 
 class S3Drop:
     """S3Drop - Secure file sharing using AWS S3 presigned URLs."""
     
-    def __init__(self, bucket_name, aws_profile=None, auto_create=True):
+    def __init__(self, bucket_name, aws_profile=None, auto_create=True, region=None):
         """
         Initialize S3Drop client.
         
+        The bucket's region is taken from region, then the region cache, and
+        only looked up with GetBucketLocation if neither has it. A region
+        given or cached is checked with HeadBucket in the background, and
+        confirmed before any link is signed for it.
+        
         Args:
             bucket_name (str): Name of your S3 bucket
             aws_profile (str): AWS profile to use (optional)
             auto_create (bool): Automatically create bucket if it doesn't exist (default: True)
+            region (str): Region the bucket is in (optional)
+        
+        Raises:
+            S3DropError: If credentials are missing or the bucket can't be used
         """
+        import boto3
+        
         self.bucket_name = bucket_name
         self.auto_create = auto_create
-        self.s3_client = self._create_s3_client(bucket_name, aws_profile)
+        # One session for every client, so credentials are resolved once
+        self._session = boto3.Session(profile_name=aws_profile) if aws_profile else boto3.Session()
+        self._temp_client = None
+        self._region_lock = threading.Lock()
+        self.s3_client = self._create_s3_client(bucket_name, region)
     
-    def _create_s3_client(self, bucket_name, aws_profile=None):
+    def _create_s3_client(self, bucket_name, region=None):
         """Create and configure S3 client with proper settings."""
+        from boto3.s3.transfer import TransferConfig
+        from botocore.config import Config
+        from botocore.exceptions import NoCredentialsError
+        
         try:
             # Detect bucket region
-            bucket_region = self._get_bucket_region(bucket_name, aws_profile)
+            bucket_region, confirmed = self._get_bucket_region(bucket_name, region)
             
-            # Configure S3 client with modern signature version
+            # Single uploads: large files go up in 50 MiB parts, 10 at a time
+            self.transfer_config = TransferConfig(
+                multipart_threshold=UPLOAD_MULTIPART_THRESHOLD,
+                multipart_chunksize=50 * 1024 * 1024,
+                max_concurrency=10,
+                use_threads=True
+            )
+            
+            # Configure S3 client with modern signature version. The pool has
+            # room for every thread of the busiest transfer, so none of them
+            # wait on a free connection
+            concurrency = max(self.transfer_config.max_concurrency,
+                              BATCH_TRANSFER_SETTINGS['max_concurrency'])
             config = Config(
                 signature_version='s3v4',
-                s3={'addressing_style': 'virtual'}
+                s3={'addressing_style': 'virtual'},
+                max_pool_connections=max(50, concurrency * 2),
+                retries={'max_attempts': 10, 'mode': 'adaptive'},
+                tcp_keepalive=True
             )
             
-            if aws_profile:
-                session = boto3.Session(profile_name=aws_profile)
-                client = session.client('s3', region_name=bucket_region, config=config)
-            else:
-                client = boto3.client('s3', region_name=bucket_region, config=config)
+            client = self._session.client('s3', region_name=bucket_region, config=config)
+            client.meta.events.register('after-call.s3', self._forget_deleted_bucket)
+            self._set_signer_id(bucket_region)
+            
+            self._region_check = None
+            if not confirmed:
+                executor = ThreadPoolExecutor(max_workers=1)
+                self._region_check = executor.submit(self._check_region, client)
+                executor.shutdown(wait=False)
             
             print(f"🌍 Connected to bucket in region: {bucket_region}")
             return client
@@ -62,62 +558,134 @@ class S3Drop:
         except NoCredentialsError:
             print("❌ AWS credentials not found.")
             print("💡 Run: aws configure")
-            sys.exit(1)
+            raise S3DropError("AWS credentials not found")
+    
+    def _set_signer_id(self, region):
+        """Identify the signing credentials and region in the share link cache."""
+        credentials = self._session.get_credentials()
+        self._signer_id = f"{credentials.access_key if credentials else ''}|{region}"
     
-    def _get_bucket_region(self, bucket_name, aws_profile=None):
-        """Get the AWS region where the bucket is located."""
+    def _forget_deleted_bucket(self, parsed=None, **kwargs):
+        """Client event hook: drop a deleted bucket from the region cache."""
+        if parsed and parsed.get('Error', {}).get('Code') == 'NoSuchBucket':
+            _forget_region(self.bucket_name)
+    
+    def _check_region(self, client):
+        """Return the bucket's region from HeadBucket, keeping the region cache up to date."""
+        from botocore.exceptions import ClientError
+        
         try:
-            # Create temporary client to get bucket location
-            if aws_profile:
-                session = boto3.Session(profile_name=aws_profile)
-                temp_client = session.client('s3')
-            else:
-                temp_client = boto3.client('s3')
+            response = client.head_bucket(Bucket=self.bucket_name)
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchBucket'):
+                _forget_region(self.bucket_name)
+            raise
+        
+        region = response['ResponseMetadata']['HTTPHeaders'].get('x-amz-bucket-region')
+        if region:
+            _store_region(self.bucket_name, region)
+        return region
+    
+    def _confirm_region(self):
+        """
+        Wait for the background check of a region that was given or cached.
+        
+        Presigned URLs aren't redirected like API calls are, so this is done
+        before signing: a client for the bucket's actual region replaces one
+        for the wrong region, and a bucket deleted since it was cached is
+        created again (or reported, without auto_create).
+        
+        Raises:
+            S3DropError: If the bucket doesn't exist and can't be created
+        """
+        from botocore.exceptions import ClientError
+        
+        with self._region_lock:
+            check, self._region_check = self._region_check, None
+            if check is None:
+                return
             
-            response = temp_client.get_bucket_location(Bucket=bucket_name)
+            try:
+                region = check.result()
+            except ClientError as e:
+                if e.response['Error']['Code'] not in ('404', 'NoSuchBucket'):
+                    return  # Not allowed to check; trust the region we have
+                if not self.auto_create:
+                    print(f"❌ Drop zone '{self.bucket_name}' does not exist")
+                    print("💡 Run: s3drop setup")
+                    raise S3DropError(f"Drop zone '{self.bucket_name}' does not exist")
+                region = self._auto_create_bucket(self.bucket_name)
+            
+            if region and region != self.s3_client.meta.region_name:
+                print(f"🌍 Drop zone is in {region}, reconnecting")
+                client = self._session.client('s3', region_name=region, config=self.s3_client.meta.config)
+                client.meta.events.register('after-call.s3', self._forget_deleted_bucket)
+                self._set_signer_id(region)
+                self.s3_client = client
+    
+    def _get_temp_client(self):
+        """Client in the session's default region, for lookups and bucket creation."""
+        if self._temp_client is None:
+            region = self._session.region_name or 'us-east-1'
+            self._temp_client = self._session.client('s3', region_name=region)
+        return self._temp_client
+    
+    def _get_bucket_region(self, bucket_name, region=None):
+        """
+        Get the AWS region where the bucket is located.
+        
+        Returns:
+            tuple: (region, confirmed), confirmed being False for a region
+                that was given, cached or guessed rather than looked up
+        """
+        from botocore.exceptions import ClientError
+        
+        region = region or _load_regions().get(bucket_name)
+        if region:
+            return region, False
+        
+        try:
+            response = self._get_temp_client().get_bucket_location(Bucket=bucket_name)
             region = response.get('LocationConstraint')
             
             # Handle special cases
             if region is None:
                 region = 'us-east-1'  # Default region
             
-            return region
+            _store_region(bucket_name, region)
+            return region, True
             
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchBucket':
                 if self.auto_create:
                     # Try to auto-create the bucket
-                    return self._auto_create_bucket(bucket_name, aws_profile)
+                    return self._auto_create_bucket(bucket_name), True
                 else:
                     print(f"❌ Drop zone '{bucket_name}' does not exist")
                     print("💡 Run: s3drop setup")
                     print("💡 Or use --auto-create flag to create automatically")
-                    sys.exit(1)
+                    raise S3DropError(f"Drop zone '{bucket_name}' does not exist")
             else:
                 print(f"⚠️ Could not determine bucket region: {e}")
-                return 'us-east-1'  # Fallback
+                return 'us-east-1', False  # Fallback
     
-    def _auto_create_bucket(self, bucket_name, aws_profile=None):
+    def _auto_create_bucket(self, bucket_name):
         """
         Automatically create a secure S3 bucket if it doesn't exist.
         
+        The bucket is created in the session's default region.
+        
         Args:
             bucket_name (str): Name of the bucket to create
-            aws_profile (str): AWS profile to use (optional)
         
         Returns:
             str: AWS region where bucket was created
         """
+        from botocore.exceptions import ClientError
+        
         try:
-            # Get current AWS region from session or use default
-            if aws_profile:
-                session = boto3.Session(profile_name=aws_profile)
-                region = session.region_name or 'us-east-1'
-                s3_client = session.client('s3', region_name=region)
-            else:
-                session = boto3.Session()
-                region = session.region_name or 'us-east-1'
-                s3_client = boto3.client('s3', region_name=region)
+            s3_client = self._get_temp_client()
+            region = s3_client.meta.region_name
             
             print(f"🪣 Drop zone '{bucket_name}' not found. Creating it...")
             print(f"📍 Region: {region}")
@@ -131,28 +699,35 @@ class S3Drop:
                     CreateBucketConfiguration={'LocationConstraint': region}
                 )
             
-            # Configure security settings
+            # Configure security settings and enable versioning; they're
+            # independent, so send both at once
             print("🔒 Securing your drop zone...")
-            s3_client.put_public_access_block(
-                Bucket=bucket_name,
-                PublicAccessBlockConfiguration={
-                    'BlockPublicAcls': True,
-                    'IgnorePublicAcls': True,
-                    'BlockPublicPolicy': True,
-                    'RestrictPublicBuckets': True
-                }
-            )
-            
-            # Enable versioning
             print("📝 Enabling file versioning...")
-            s3_client.put_bucket_versioning(
-                Bucket=bucket_name,
-                VersioningConfiguration={'Status': 'Enabled'}
-            )
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                settings = [
+                    executor.submit(
+                        s3_client.put_public_access_block,
+                        Bucket=bucket_name,
+                        PublicAccessBlockConfiguration={
+                            'BlockPublicAcls': True,
+                            'IgnorePublicAcls': True,
+                            'BlockPublicPolicy': True,
+                            'RestrictPublicBuckets': True
+                        }
+                    ),
+                    executor.submit(
+                        s3_client.put_bucket_versioning,
+                        Bucket=bucket_name,
+                        VersioningConfiguration={'Status': 'Enabled'}
+                    ),
+                ]
+                for future in settings:
+                    future.result()
             
             print(f"✅ Drop zone '{bucket_name}' created successfully!")
             print("🔐 Your drop zone is private and secure")
             
+            _store_region(bucket_name, region)
             return region
             
         except ClientError as e:
@@ -171,19 +746,31 @@ class S3Drop:
             
             print(f"\n💡 Alternative: Create the drop zone manually:")
             print(f"   s3drop setup")
-            sys.exit(1)
+            raise S3DropError(f"Failed to create drop zone '{bucket_name}'") from e
     
-    def upload_file(self, local_file_path, s3_key=None):
+    def upload_file(self, local_file_path, s3_key=None, part_size=None, concurrency=None):
         """
         Upload a file to S3.
         
+        Smaller files are sent with a single PutObject. Files of
+        UPLOAD_MULTIPART_THRESHOLD or more go up as a multipart upload with
+        several parts in flight at once; an upload that fails part way is
+        aborted so no orphaned parts are left in the bucket.
+        
         Args:
             local_file_path (str): Path to local file
             s3_key (str): S3 object key (optional, uses filename if not provided)
+            part_size (int): Multipart part size in bytes (optional, defaults
+                to transfer_config's 50 MiB)
+            concurrency (int): Parts uploaded at once (optional, defaults to
+                transfer_config's 10)
         
         Returns:
             str: S3 key of uploaded file
         """
+        from boto3.s3.transfer import TransferConfig
+        from botocore.exceptions import ClientError
+        
         if not os.path.exists(local_file_path):
             raise FileNotFoundError(f"File not found: {local_file_path}")
         
@@ -191,10 +778,31 @@ class S3Drop:
             s3_key = os.path.basename(local_file_path)
         
         try:
-            file_size = os.path.getsize(local_file_path) / (1024 * 1024)  # MB
-            print(f"📤 Dropping {local_file_path} ({file_size:.2f} MB)")
+            file_size = os.path.getsize(local_file_path)
+            print(f"📤 Dropping {local_file_path} ({_format_mb(file_size)} MB)")
             
-            self.s3_client.upload_file(local_file_path, self.bucket_name, s3_key)
+            config = self.transfer_config
+            if file_size < config.multipart_threshold:
+                # One request either way, so skip the transfer manager's
+                # thread pool and send the file straight from disk
+                with open(local_file_path, 'rb') as f:
+                    self.s3_client.put_object(Bucket=self.bucket_name, Key=s3_key, Body=f,
+                                              ChecksumAlgorithm=_checksum_algorithm())
+            else:
+                if part_size or concurrency:
+                    config = TransferConfig(
+                        multipart_threshold=config.multipart_threshold,
+                        multipart_chunksize=part_size or config.multipart_chunksize,
+                        max_concurrency=concurrency or config.max_concurrency,
+                        use_threads=True
+                    )
+                tracker = ProgressTracker(file_size)
+                try:
+                    self.s3_client.upload_file(local_file_path, self.bucket_name, s3_key,
+                                               ExtraArgs={'ChecksumAlgorithm': _checksum_algorithm()},
+                                               Config=config, Callback=tracker)
+                finally:
+                    tracker.finish()
             print(f"✅ Drop successful: s3://{self.bucket_name}/{s3_key}")
             return s3_key
             
@@ -202,30 +810,198 @@ class S3Drop:
             print(f"❌ Drop failed: {e}")
             raise
     
-    def generate_share_link(self, s3_key, expiration_hours=24):
+    def upload_files(self, local_file_paths, expiration_hours=None, max_workers=20):
+        """
+        Upload several files concurrently over the shared S3 client.
+        
+        Args:
+            local_file_paths (list): Paths to local files
+            expiration_hours (int): Also generate share links valid for this
+                many hours (optional)
+            max_workers (int): Maximum number of files in progress at once;
+                S3 requests are capped by BATCH_TRANSFER_SETTINGS max_concurrency
+        
+        Yields:
+            dict: Result per file, in completion order, with 'path', 'key'
+                and 'ok', plus 'url' on success or 'error' on failure
+        """
+        from boto3.s3.transfer import TransferConfig, create_transfer_manager
+        
+        # Files that would land on the same key can't all be kept, so fail
+        # them up front instead of letting the uploads race each other
+        key_counts = {}
+        for path in local_file_paths:
+            key = os.path.basename(path)
+            key_counts[key] = key_counts.get(key, 0) + 1
+        
+        to_upload = []
+        for path in local_file_paths:
+            key = os.path.basename(path)
+            if key_counts[key] > 1:
+                yield {'path': path, 'key': key, 'ok': False,
+                       'error': f"Duplicate S3 key '{key}' in this batch"}
+            else:
+                to_upload.append(path)
+        
+        if not to_upload:
+            return
+        if expiration_hours is not None:
+            self._confirm_region()
+        
+        def drop_one(local_file_path):
+            s3_key = os.path.basename(local_file_path)
+            transfer = manager.upload(local_file_path, self.bucket_name, s3_key,
+                                      extra_args={'ChecksumAlgorithm': _checksum_algorithm()})
+            transfers.append(transfer)
+            transfer.result()
+            url = None
+            if expiration_hours is not None:
+                # Just uploaded, so there's no need to check it exists
+                url, _ = _presign(
+                    self.s3_client, self._signer_id, self.bucket_name, s3_key,
+                    expiration_hours * 3600, check_exists=False
+                )
+            return s3_key, url
+        
+        transfers = []
+        workers = min(max_workers, len(to_upload))
+        with create_transfer_manager(self.s3_client, TransferConfig(**BATCH_TRANSFER_SETTINGS)) as manager, \
+                ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(drop_one, path): path
+                for path in to_upload
+            }
+            
+            try:
+                for future in as_completed(futures):
+                    path = futures[future]
+                    result = {'path': path, 'key': os.path.basename(path)}
+                    try:
+                        result['key'], url = future.result()
+                    except Exception as e:
+                        result.update(ok=False, error=str(e))
+                    else:
+                        result['ok'] = True
+                        if url:
+                            result['url'] = url
+                    yield result
+            finally:
+                # The caller stopped early (close() or Ctrl-C): drop queued
+                # files and abort in-flight transfers rather than finishing them
+                for future in futures:
+                    future.cancel()
+                for transfer in transfers:
+                    transfer.cancel()
+    
+    def download_file(self, s3_key, local_path=None, concurrency=10, part_size=16 * 1024 * 1024):
+        """
+        Download a file from S3.
+        
+        Files larger than part_size are fetched as concurrent byte-range GETs
+        written straight into place. The download goes to a temporary file
+        that is only renamed to local_path once every part has arrived.
+        
+        Args:
+            s3_key (str): S3 object key
+            local_path (str): Where to save the file (optional, uses the
+                key's filename in the current directory if not provided)
+            concurrency (int): Parts downloaded at once (default: 10)
+            part_size (int): Byte-range size in bytes (default: 16 MiB)
+        
+        Returns:
+            str: Path of the downloaded file
+        """
+        from botocore.exceptions import ClientError
+        
+        if not local_path:
+            local_path = os.path.basename(s3_key)
+        
+        try:
+            head = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+        except ClientError as e:
+            if e.response['Error']['Code'] == '404':
+                print(f"❌ File not found: {s3_key}")
+            else:
+                print(f"❌ Fetch failed: {e}")
+            raise
+        
+        size = head['ContentLength']
+        print(f"📥 Fetching {s3_key} ({_format_mb(size)} MB)")
+        
+        def fetch_range(fd, start):
+            end = min(start + part_size, size) - 1
+            # IfMatch makes a file replaced mid-download fail instead of
+            # mixing parts of two versions
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name, Key=s3_key,
+                Range=f"bytes={start}-{end}", IfMatch=head['ETag']
+            )
+            offset = start
+            for chunk in response['Body'].iter_chunks(1024 * 1024):
+                offset += _write_at(fd, chunk, offset)
+        
+        tmp_path = f"{local_path}.{os.getpid()}.part"
+        fd = os.open(tmp_path, os.O_CREAT | os.O_TRUNC | os.O_RDWR | getattr(os, 'O_BINARY', 0), 0o666)
+        try:
+            if size:
+                if hasattr(os, 'posix_fallocate'):
+                    os.posix_fallocate(fd, 0, size)
+                else:
+                    os.ftruncate(fd, size)
+            
+            starts = range(0, size, part_size)
+            if len(starts) <= 1:
+                if size:
+                    fetch_range(fd, 0)
+            else:
+                with ThreadPoolExecutor(max_workers=min(concurrency, len(starts))) as executor:
+                    futures = [executor.submit(fetch_range, fd, start) for start in starts]
+                    try:
+                        for future in as_completed(futures):
+                            future.result()
+                    finally:
+                        for future in futures:
+                            future.cancel()
+            
+            os.close(fd)
+            fd = None
+            os.replace(tmp_path, local_path)
+        except ClientError as e:
+            print(f"❌ Fetch failed: {e}")
+            raise
+        finally:
+            if fd is not None:
+                os.close(fd)
+                os.remove(tmp_path)
+        
+        print(f"✅ Fetch successful: {local_path}")
+        return local_path
+    
+    def generate_share_link(self, s3_key, expiration_hours=24, verify=False):
         """
         Generate a secure share link for downloading a file.
         
+        Signing is done locally; with verify the file's existence is checked
+        first, which costs a request to S3.
+        
         Args:
             s3_key (str): S3 object key
             expiration_hours (int): Hours until link expires (default: 24)
+            verify (bool): Check that the file exists first (default: False)
         
         Returns:
             tuple: (share_url, expiry_datetime)
         """
+        from botocore.exceptions import ClientError
+        
         try:
-            # Verify file exists
-            self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
-            
-            # Generate presigned URL
-            expiration_seconds = expiration_hours * 3600
-            url = self.s3_client.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': self.bucket_name, 'Key': s3_key},
-                ExpiresIn=expiration_seconds
+            self._confirm_region()
+            # Optionally verify the file exists, then generate a presigned URL
+            # (both skipped if a link was issued within the cache window)
+            url, expiry_time = _presign(
+                self.s3_client, self._signer_id, self.bucket_name, s3_key,
+                expiration_hours * 3600, check_exists=verify
             )
-            
-            expiry_time = datetime.now() + timedelta(hours=expiration_hours)
             print(f"🔗 Generated secure share link for: {s3_key}")
             print(f"⏰ Link expires: {expiry_time.strftime('%Y-%m-%d %H:%M:%S')}")
             
@@ -238,6 +1014,51 @@ class S3Drop:
                 print(f"❌ Error generating share link: {e}")
             raise
     
+    def generate_share_links(self, s3_keys, expiration_hours=24, verify_exist=False):
+        """
+        Generate share links for several files at once.
+        
+        Links are signed locally, so this makes no requests to S3 unless
+        verify_exist is set; the existence checks then run concurrently.
+        
+        Args:
+            s3_keys (list): S3 object keys
+            expiration_hours (int): Hours until links expire (default: 24)
+            verify_exist (bool): Check that each file exists first (default: False)
+        
+        Returns:
+            dict: S3 key to (share_url, expiry_datetime), or to None for
+                files that don't exist when verify_exist is set
+        """
+        from botocore.exceptions import ClientError
+        
+        def exists(s3_key):
+            try:
+                self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+            except ClientError as e:
+                if e.response['Error']['Code'] == '404':
+                    return False
+                raise
+            return True
+        
+        self._confirm_region()
+        s3_keys = list(s3_keys)
+        found = s3_keys
+        if verify_exist and s3_keys:
+            with ThreadPoolExecutor(max_workers=min(20, len(s3_keys))) as executor:
+                found = [key for key, ok in zip(s3_keys, executor.map(exists, s3_keys)) if ok]
+        
+        links = dict.fromkeys(s3_keys)
+        links.update(_presign_many(
+            self.s3_client, self._signer_id, self.bucket_name, found, expiration_hours * 3600
+        ))
+        
+        print(f"🔗 Generated {len(found)} secure share links")
+        missing = [key for key in s3_keys if links[key] is None]
+        if missing:
+            print(f"❌ Files not found: {', '.join(missing)}")
+        return links
+    
     def verify_share_link(self, url):
         """
         Verify that a share link is accessible.
@@ -248,20 +1069,29 @@ class S3Drop:
         Returns:
             bool: True if accessible, False otherwise
         """
+        import requests
+        
         try:
             print("🔍 Verifying share link...")
-            response = requests.head(url, timeout=10, allow_redirects=True)
-            
-            if response.status_code == 200:
+            # Share links are signed for GET, so a HEAD would be rejected; ask
+            # for the first byte only and don't download the body
+            with _http().get(url, headers={'Range': 'bytes=0-0'}, stream=True,
+                             timeout=10, allow_redirects=True) as response:
+                status = response.status_code
+                content_range = response.headers.get('content-range', '')
                 content_length = response.headers.get('content-length')
-                if content_length:
-                    size_mb = int(content_length) / (1024 * 1024)
-                    print(f"✅ Link verified! File size: {size_mb:.2f} MB")
+            
+            # 206 for a partial response, 416 for an empty file
+            if status in (200, 206, 416):
+                if '/' in content_range:
+                    content_length = content_range.rsplit('/', 1)[1]
+                if content_length and content_length.isdigit():
+                    print(f"✅ Link verified! File size: {_format_mb(int(content_length))} MB")
                 else:
                     print("✅ Link verified!")
                 return True
             else:
-                print(f"❌ Link verification failed: HTTP {response.status_code}")
+                print(f"❌ Link verification failed: HTTP {status}")
                 print("💡 Note: Link may still work for recipients")
                 return False
                 
@@ -270,125 +1100,186 @@ class S3Drop:
             print("💡 Note: Link may still work for recipients")
             return False
     
-    def shorten_url(self, long_url, service='tinyurl'):
+    def shorten_url(self, long_url, service='tinyurl', session=None):
         """
         Shorten a URL using various free URL shortening services.
         
+        Several services can be given as fallbacks; they are all asked at
+        once and the first one to answer wins.
+        
         Args:
             long_url (str): The long URL to shorten
-            service (str): URL shortening service to use ('tinyurl', 'isgd', 'vgd', '1ptco')
+            service (str or list): URL shortening service(s) to use
+                ('tinyurl', 'isgd', 'vgd', '1ptco')
+            session (requests.Session, optional): Session to send the
+                requests through, e.g. to share connections with other calls
         
         Returns:
             str: Shortened URL or original URL if shortening fails
         """
-        try:
-            print(f"🔗 Shortening URL with {service.upper()}...")
-            
-            if service == 'tinyurl':
-                return self._shorten_with_tinyurl(long_url)
-            elif service == 'isgd':
-                return self._shorten_with_isgd(long_url)
-            elif service == 'vgd':
-                return self._shorten_with_vgd(long_url)
-            elif service == '1ptco':
-                return self._shorten_with_1ptco(long_url)
-            else:
-                print(f"⚠️ Unknown service '{service}', using original URL")
-                return long_url
-                
-        except Exception as e:
-            print(f"⚠️ URL shortening failed: {e}")
+        return self._start_shorten(long_url, service, session)()
+    
+    def _start_shorten(self, long_url, service='tinyurl', session=None):
+        """
+        Start shortening a URL in the background, as in shorten_url.
+        
+        Returns:
+            callable: Waits for the result and returns what shorten_url would;
+                all messages are printed by this call and the returned one,
+                so they don't interleave with another thread's output
+        """
+        services = [service] if isinstance(service, str) else list(service)
+        print(f"🔗 Shortening URL with {', '.join(s.upper() for s in services)}...")
+        
+        unknown = [s for s in services if s not in _SHORTENERS]
+        if unknown:
+            print(f"⚠️ Unknown service '{unknown[0]}', using original URL")
+            return lambda: long_url
+        
+        # Daemon threads, so services that lose the race don't keep the
+        # process alive after the winning link has been printed
+        answers = queue.Queue()
+        
+        def ask(service):
+            try:
+                answers.put((_shorten(long_url, service, session), None))
+            except Exception as e:
+                answers.put((None, e))
+        
+        for s in services:
+            threading.Thread(target=ask, args=(s,), daemon=True).start()
+        
+        def finish():
+            errors = []
+            for _ in services:
+                short_url, error = answers.get()
+                if error is None:
+                    print("✅ URL shortened successfully!")
+                    return short_url
+                errors.append(error)
+            
+            print(f"⚠️ URL shortening failed: {'; '.join(str(e) for e in errors)}")
             print("💡 Using original URL")
             return long_url
-    
-    def _shorten_with_tinyurl(self, long_url):
-        """Shorten URL using TinyURL API."""
-        api_url = "http://tinyurl.com/api-create.php"
-        params = {'url': long_url}
         
-        response = requests.get(api_url, params=params, timeout=10)
-        response.raise_for_status()
+        return finish
+    
+    def _iter_pages(self, prefix='', **kwargs):
+        """Yield the objects of each list_objects_v2 page under a prefix as it arrives."""
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix,
+                                       PaginationConfig={'PageSize': 1000}, **kwargs):
+            yield page.get('Contents', [])
+    
+    def _feed_pages(self, prefix, pages, stop):
+        """List a prefix into a queue of pages, ending with None or the error raised."""
+        def put(item):
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
         
-        short_url = response.text.strip()
-        if short_url.startswith('http'):
-            print("✅ URL shortened successfully!")
-            return short_url
-        else:
-            raise Exception(f"TinyURL error: {short_url}")
-    
-    def _shorten_with_isgd(self, long_url):
-        """Shorten URL using is.gd API."""
-        api_url = "https://is.gd/create.php"
-        params = {
-            'format': 'simple',
-            'url': long_url
-        }
-        
-        response = requests.get(api_url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        short_url = response.text.strip()
-        if short_url.startswith('http'):
-            print("✅ URL shortened successfully!")
-            return short_url
-        else:
-            raise Exception(f"is.gd error: {short_url}")
-    
-    def _shorten_with_vgd(self, long_url):
-        """Shorten URL using v.gd API."""
-        api_url = "https://v.gd/create.php"
-        params = {
-            'format': 'simple',
-            'url': long_url
-        }
-        
-        response = requests.get(api_url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        short_url = response.text.strip()
-        if short_url.startswith('http'):
-            print("✅ URL shortened successfully!")
-            return short_url
-        else:
-            raise Exception(f"v.gd error: {short_url}")
+        try:
+            for objects in self._iter_pages(prefix):
+                if not put(objects):
+                    return
+        except Exception as e:
+            put(e)
+            return
+        put(None)
     
-    def _shorten_with_1ptco(self, long_url):
-        """Shorten URL using 1pt.co API."""
-        api_url = "https://1pt.co/addURL"
-        data = {'long': long_url}
+    def iter_files(self, max_workers=16):
+        """
+        Iterate over all files in the S3 bucket, in key order, as listing
+        pages arrive.
+        
+        When the top level holds a few "folders", each is listed concurrently
+        with its own paginator, so they don't pay for one round trip per 1000
+        keys in sequence. Flat buckets and buckets with many folders are
+        listed with a single paginator instead.
+        
+        Args:
+            max_workers (int): Maximum number of folders listed at once
+        
+        Yields:
+            dict: Object summary from list_objects_v2 ('Key', 'Size', 'LastModified', ...)
+        """
+        root = self.s3_client.list_objects_v2(Bucket=self.bucket_name, Delimiter='/')
+        objects = root.get('Contents', [])
+        prefixes = [p['Prefix'] for p in root.get('CommonPrefixes', [])]
         
-        response = requests.post(api_url, data=data, timeout=10)
-        response.raise_for_status()
+        if not prefixes:
+            # Nothing nested in the first page: carry on from its last key
+            yield from objects
+            if root.get('IsTruncated'):
+                for page in self._iter_pages(StartAfter=objects[-1]['Key']):
+                    yield from page
+            return
         
-        result = response.json()
-        if result.get('status') == 'success':
-            short_url = result.get('short')
-            if short_url:
-                print("✅ URL shortened successfully!")
-                return short_url
+        if root.get('IsTruncated') or len(prefixes) > LIST_FANOUT_MAX_PREFIXES:
+            # One LIST per folder would cost more than it saves
+            for page in self._iter_pages():
+                yield from page
+            return
         
-        raise Exception(f"1pt.co error: {result.get('msg', 'Unknown error')}")
+        # Each folder's pages are queued as they arrive, a couple at a time, so
+        # later folders are fetched ahead while earlier ones are yielded
+        stop = threading.Event()
+        queues = {prefix: queue.Queue(maxsize=2) for prefix in prefixes}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prefixes))) as executor:
+            futures = [executor.submit(self._feed_pages, prefix, queues[prefix], stop)
+                       for prefix in prefixes]
+            try:
+                # Top-level keys and folders don't overlap, so ordering them
+                # by name keeps the overall listing in key order
+                entries = [(obj['Key'], obj) for obj in objects] + [(prefix, None) for prefix in prefixes]
+                for name, obj in sorted(entries, key=lambda e: e[0]):
+                    if obj is not None:
+                        yield obj
+                        continue
+                    for page in iter(queues[name].get, None):
+                        if isinstance(page, Exception):
+                            raise page
+                        yield from page
+            finally:
+                stop.set()
+                for future in futures:
+                    future.cancel()
     
     def list_files(self):
         """List all files in the S3 bucket."""
+        from botocore.exceptions import ClientError
+        
         try:
-            response = self.s3_client.list_objects_v2(Bucket=self.bucket_name)
+            objects = list(self.iter_files())
             
-            if 'Contents' not in response:
+            if not objects:
                 print("📁 Drop zone is empty")
                 return []
             
-            files = []
-            print(f"📁 Files in your drop zone (s3://{self.bucket_name}):")
-            print("-" * 60)
+            files = [obj['Key'] for obj in objects]
+            header = [f"📁 Files in your drop zone (s3://{self.bucket_name}):", "-" * 60]
             
-            for obj in response['Contents']:
-                size_mb = obj['Size'] / (1024 * 1024)
-                modified = obj['LastModified'].strftime('%Y-%m-%d %H:%M')
-                print(f"📄 {obj['Key']}")
-                print(f"   Size: {size_mb:.2f} MB | Modified: {modified}")
-                files.append(obj['Key'])
+            if len(objects) > LIST_COMPACT_THRESHOLD:
+                # isoformat skips strftime's format parsing, which adds up
+                # over thousands of rows
+                header.append("Key\tSize (MB)\tModified")
+                rows = [
+                    f"{obj['Key']}\t{_format_mb(obj['Size'])}\t{obj['LastModified'].isoformat(' ', 'minutes')}"
+                    for obj in objects
+                ]
+            else:
+                rows = [
+                    f"📄 {obj['Key']}\n"
+                    f"   Size: {_format_mb(obj['Size'])} MB | Modified: {obj['LastModified']:{LIST_TIME_FORMAT}}"
+                    for obj in objects
+                ]
             
+            # One write for the whole listing instead of two per file
+            print('\n'.join(header + rows))
             return files
             
         except ClientError as e:
@@ -396,6 +1287,158 @@ class S3Drop:
             raise
 
 
+def parse_expiration(expires_str):
+    """Parse expiration string like '24h', '2d', '48h' into hours."""
+    expires_str = expires_str.lower()
+    if expires_str.endswith('h'):
+        return int(expires_str[:-1])
+    elif expires_str.endswith('d'):
+        return int(expires_str[:-1]) * 24
+    else:
+        return int(expires_str)  # Assume hours
+
+
+_drop_zones = {}
+
+
+def get_drop_zone(zone, aws_profile=None, auto_create=True):
+    """
+    Get a connected S3Drop client for a drop zone.
+    
+    Clients are cached per zone, profile and auto_create setting, so repeated
+    library calls skip the region lookup and share one connection pool.
+    
+    Args:
+        zone (str): Drop zone (S3 bucket) name
+        aws_profile (str): AWS profile to use (optional)
+        auto_create (bool): Automatically create bucket if it doesn't exist (default: True)
+    
+    Returns:
+        S3Drop: Client for the drop zone
+    
+    Raises:
+        S3DropError: If the drop zone can't be reached or created
+    """
+    cache_key = (zone, aws_profile, auto_create)
+    s3drop = _drop_zones.get(cache_key)
+    if s3drop is None:
+        s3drop = S3Drop(zone, aws_profile, auto_create)
+        _drop_zones[cache_key] = s3drop
+    return s3drop
+
+
+def _share_link(s3drop, s3_key, expires, short, verify=False):
+    """Generate a (optionally shortened) share link and describe it as a dict."""
+    url, expires_at = s3drop.generate_share_link(s3_key, parse_expiration(expires), verify)
+    if short:
+        url = s3drop.shorten_url(url, short)
+    return {'key': s3_key, 'url': url, 'expires_at': expires_at}
+
+
+def drop(zone, path, share=False, expires='24h', short=None, key=None, aws_profile=None):
+    """
+    Drop a file into a drop zone.
+    
+    Args:
+        zone (str): Drop zone (S3 bucket) name
+        path (str): Local file path to drop
+        share (bool): Generate share link after dropping
+        expires (str): Link expiration (e.g., '24h', '2d', '48h')
+        short (str): URL shortening service to use (optional)
+        key (str): Custom S3 key (optional)
+        aws_profile (str): AWS profile to use (optional)
+    
+    Returns:
+        dict: 'key' of the dropped file, plus 'url' and 'expires_at' when shared
+    """
+    s3drop = get_drop_zone(zone, aws_profile)
+    s3_key = s3drop.upload_file(path, key)
+    if share:
+        return _share_link(s3drop, s3_key, expires, short)
+    return {'key': s3_key}
+
+
+def share(zone, key, expires='24h', short=None, aws_profile=None):
+    """
+    Generate a share link for a file already in a drop zone.
+    
+    Args:
+        zone (str): Drop zone (S3 bucket) name
+        key (str): S3 object key
+        expires (str): Link expiration (e.g., '24h', '2d', '48h')
+        short (str): URL shortening service to use (optional)
+        aws_profile (str): AWS profile to use (optional)
+    
+    Returns:
+        dict: 'key', 'url' and 'expires_at' of the share link
+    """
+    # The key comes from the caller, so make sure it exists before sharing it
+    return _share_link(get_drop_zone(zone, aws_profile), key, expires, short, verify=True)
+
+
+def drop_many(zone, paths, share=False, expires='24h', aws_profile=None):
+    """
+    Drop several files into a drop zone concurrently.
+    
+    Args:
+        zone (str): Drop zone (S3 bucket) name
+        paths (list): Local file paths to drop
+        share (bool): Generate share links after dropping
+        expires (str): Link expiration (e.g., '24h', '2d', '48h')
+        aws_profile (str): AWS profile to use (optional)
+    
+    Yields:
+        dict: Result per file as it completes (see S3Drop.upload_files)
+    """
+    expiration_hours = parse_expiration(expires) if share else None
+    return get_drop_zone(zone, aws_profile).upload_files(paths, expiration_hours)
+
+
+def iter_keys(zone, aws_profile=None):
+    """
+    Iterate over the keys in a drop zone as listing pages arrive.
+    
+    Args:
+        zone (str): Drop zone (S3 bucket) name
+        aws_profile (str): AWS profile to use (optional)
+    
+    Yields:
+        str: S3 keys of the files in the drop zone
+    """
+    for obj in get_drop_zone(zone, aws_profile).iter_files():
+        yield obj['Key']
+
+
+def fetch(zone, key, path=None, aws_profile=None):
+    """
+    Download a file from a drop zone.
+    
+    Args:
+        zone (str): Drop zone (S3 bucket) name
+        key (str): S3 object key
+        path (str): Where to save the file (optional, uses the key's filename)
+        aws_profile (str): AWS profile to use (optional)
+    
+    Returns:
+        str: Path of the downloaded file
+    """
+    return get_drop_zone(zone, aws_profile).download_file(key, path)
+
+
+def list_files(zone, aws_profile=None):
+    """
+    List all files in a drop zone.
+    
+    Args:
+        zone (str): Drop zone (S3 bucket) name
+        aws_profile (str): AWS profile to use (optional)
+    
+    Returns:
+        list: S3 keys of the files in the drop zone
+    """
+    return get_drop_zone(zone, aws_profile).list_files()
+
+
 def print_banner():
     """Print S3Drop banner."""
     print("""
@@ -410,6 +1453,38 @@ def print_banner():
 """)
 
 
+def _share_and_print(s3drop, s3_key, args, check_exists=False, upload=None):
+    """
+    Generate, verify and shorten a share link for the CLI, then print it.
+    
+    With upload, the file is uploaded here too: the link is signed locally
+    and doesn't depend on the upload, so it is shortened while the file is
+    still uploading, and only verified once the upload is done.
+    """
+    expires_hours = parse_expiration(args.expires)
+    url, expires_at = s3drop.generate_share_link(s3_key, expires_hours, check_exists)
+    
+    # Shortening, uploading and verifying are separate round trips, so
+    # overlap them as far as they allow
+    finish_shorten = s3drop._start_shorten(url, args.short_service) if args.short else None
+    if upload:
+        upload()
+    if args.verify:
+        s3drop.verify_share_link(url)
+    final_url = finish_shorten() if finish_shorten else url
+    
+    print(f"\n🔗 Secure Share Link:")
+    print(f"{final_url}")
+    
+    if args.short and final_url != url:
+        print(f"\n📏 Original URL length: {len(url)} characters")
+        print(f"📏 Shortened URL length: {len(final_url)} characters")
+        print(f"💾 Saved: {len(url) - len(final_url)} characters")
+    
+    print(f"\n📧 Share this link with your recipients!")
+    print(f"⏰ Expires: {expires_at.strftime('%Y-%m-%d at %H:%M')}")
+
+
 def main():
     """Main CLI interface."""
     parser = argparse.ArgumentParser(
@@ -420,6 +1495,8 @@ Examples:
   %(prog)s my-drops drop video.mp4 --share
   %(prog)s my-drops drop video.mp4 --share --short
   %(prog)s my-drops share video.mp4 --expires 48h --short
+  %(prog)s my-drops drop-many a.pdf b.pdf --share
+  %(prog)s my-drops fetch video.mp4
   %(prog)s my-drops list
   %(prog)s setup
 
@@ -430,6 +1507,8 @@ For more help: https://github.com/kahhaw-thian/s3drop
     parser.add_argument('--version', action='version', version=f'S3Drop {__version__}')
     parser.add_argument('bucket', nargs='?', help='S3 bucket name')
     parser.add_argument('--profile', help='AWS profile to use')
+    parser.add_argument('--region',
+                       help='Region the bucket is in; skips the region lookup')
     parser.add_argument('--no-auto-create', action='store_true', 
                        help='Disable automatic bucket creation')
     
@@ -451,7 +1530,8 @@ For more help: https://github.com/kahhaw-thian/s3drop
     drop_parser.add_argument('--short', action='store_true',
                             help='Create shortened URL for easier sharing')
     drop_parser.add_argument('--short-service', choices=['tinyurl', 'isgd', 'vgd', '1ptco'],
-                            default='tinyurl', help='URL shortening service (default: tinyurl)')
+                            nargs='+', default='tinyurl',
+                            help='URL shortening service; give several to use whichever answers first (default: tinyurl)')
     
     # Share command (generate link)
     share_parser = subparsers.add_parser('share', help='Generate share link for existing file')
@@ -463,7 +1543,23 @@ For more help: https://github.com/kahhaw-thian/s3drop
     share_parser.add_argument('--short', action='store_true',
                              help='Create shortened URL for easier sharing')
     share_parser.add_argument('--short-service', choices=['tinyurl', 'isgd', 'vgd', '1ptco'],
-                             default='tinyurl', help='URL shortening service (default: tinyurl)')
+                             nargs='+', default='tinyurl',
+                             help='URL shortening service; give several to use whichever answers first (default: tinyurl)')
+    
+    # Drop-many command (batch upload)
+    drop_many_parser = subparsers.add_parser(
+        'drop-many', help='Drop several files at once (prints one JSON line per file)'
+    )
+    drop_many_parser.add_argument('files', nargs='+', help='Local file paths to drop')
+    drop_many_parser.add_argument('--share', action='store_true',
+                                 help='Generate share links after dropping')
+    drop_many_parser.add_argument('--expires', type=str, default='24h',
+                                 help='Link expiration (e.g., 24h, 2d, 48h)')
+    
+    # Fetch command (download)
+    fetch_parser = subparsers.add_parser('fetch', help='Download a file from your drop zone')
+    fetch_parser.add_argument('key', help='S3 object key')
+    fetch_parser.add_argument('-o', '--output', help='Local path to save to (default: the key\'s filename)')
     
     # List command
     list_parser = subparsers.add_parser('list', help='List files in your drop zone')
@@ -473,6 +1569,7 @@ For more help: https://github.com/kahhaw-thian/s3drop
     # Handle setup command separately
     if args.command == 'setup':
         from setup_bucket import main as setup_main
+        
         setup_main()
         return
     
@@ -481,26 +1578,27 @@ For more help: https://github.com/kahhaw-thian/s3drop
         parser.print_help()
         return
     
+    # Keep stdout machine-readable for drop-many: only the JSON lines go
+    # there, every status and error message goes to stderr
+    json_out = sys.stdout
+    status_out = sys.stderr if args.command == 'drop-many' else sys.stdout
+    with redirect_stdout(status_out):
+        _run(args, json_out)
+
+
+def _run(args, json_out):
+    """Run a parsed CLI command, writing drop-many results to json_out."""
     if not args.bucket:
         print("❌ Bucket name is required")
         print("💡 Usage: s3drop <bucket-name> <command>")
         sys.exit(1)
     
-    # Parse expiration time
-    def parse_expiration(expires_str):
-        """Parse expiration string like '24h', '2d', '48h' into hours."""
-        expires_str = expires_str.lower()
-        if expires_str.endswith('h'):
-            return int(expires_str[:-1])
-        elif expires_str.endswith('d'):
-            return int(expires_str[:-1]) * 24
-        else:
-            return int(expires_str)  # Assume hours
-    
     # Initialize S3Drop client
     try:
         auto_create = not args.no_auto_create
-        s3drop = S3Drop(args.bucket, args.profile, auto_create)
+        s3drop = S3Drop(args.bucket, args.profile, auto_create, args.region)
+    except S3DropError:
+        sys.exit(1)  # Details already printed
     except Exception as e:
         print(f"❌ Failed to initialize S3Drop: {e}")
         sys.exit(1)
@@ -508,53 +1606,30 @@ For more help: https://github.com/kahhaw-thian/s3drop
     # Execute commands
     try:
         if args.command == 'drop':
-            s3_key = s3drop.upload_file(args.file, args.key)
-            
             if args.share:
-                expires_hours = parse_expiration(args.expires)
-                url, expires_at = s3drop.generate_share_link(s3_key, expires_hours)
-                
-                if args.verify:
-                    s3drop.verify_share_link(url)
-                
-                # Shorten URL if requested
-                final_url = url
-                if args.short:
-                    final_url = s3drop.shorten_url(url, args.short_service)
-                
-                print(f"\n🔗 Secure Share Link:")
-                print(f"{final_url}")
-                
-                if args.short and final_url != url:
-                    print(f"\n📏 Original URL length: {len(url)} characters")
-                    print(f"📏 Shortened URL length: {len(final_url)} characters")
-                    print(f"💾 Saved: {len(url) - len(final_url)} characters")
-                
-                print(f"\n📧 Share this link with your recipients!")
-                print(f"⏰ Expires: {expires_at.strftime('%Y-%m-%d at %H:%M')}")
+                if not os.path.exists(args.file):
+                    raise FileNotFoundError(f"File not found: {args.file}")
+                s3_key = args.key or os.path.basename(args.file)
+                _share_and_print(s3drop, s3_key, args,
+                                 upload=lambda: s3drop.upload_file(args.file, s3_key))
+            else:
+                s3drop.upload_file(args.file, args.key)
         
         elif args.command == 'share':
-            expires_hours = parse_expiration(args.expires)
-            url, expires_at = s3drop.generate_share_link(args.key, expires_hours)
-            
-            if args.verify:
-                s3drop.verify_share_link(url)
-            
-            # Shorten URL if requested
-            final_url = url
-            if args.short:
-                final_url = s3drop.shorten_url(url, args.short_service)
-            
-            print(f"\n🔗 Secure Share Link:")
-            print(f"{final_url}")
-            
-            if args.short and final_url != url:
-                print(f"\n📏 Original URL length: {len(url)} characters")
-                print(f"📏 Shortened URL length: {len(final_url)} characters")
-                print(f"💾 Saved: {len(url) - len(final_url)} characters")
-            
-            print(f"\n📧 Share this link with your recipients!")
-            print(f"⏰ Expires: {expires_at.strftime('%Y-%m-%d at %H:%M')}")
+            # Typos in the key should fail here, not for the recipient
+            _share_and_print(s3drop, args.key, args, check_exists=True)
+        
+        elif args.command == 'drop-many':
+            expires_hours = parse_expiration(args.expires) if args.share else None
+            failed = False
+            for result in s3drop.upload_files(args.files, expires_hours):
+                print(json.dumps(result), file=json_out, flush=True)
+                failed = failed or not result['ok']
+            if failed:
+                sys.exit(1)
+        
+        elif args.command == 'fetch':
+            s3drop.download_file(args.key, args.output)
         
         elif args.command == 'list':
             s3drop.list_files()
@@ -564,6 +1639,14 @@ For more help: https://github.com/kahhaw-thian/s3drop
         sys.exit(0)
     except Exception as e:
         print(f"❌ Operation failed: {e}")
+        if 'NoSuchBucket' in str(e):
+            # The region cache has already forgotten the bucket
+            if args.no_auto_create:
+                print("💡 The drop zone no longer exists; run: s3drop setup")
+            elif args.region:
+                print("💡 The drop zone no longer exists; run the command again without --region to recreate it")
+            else:
+                print("💡 The drop zone no longer exists; run the command again to recreate it")
         sys.exit(1)
 
 
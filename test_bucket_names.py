@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test script for S3Drop drop zone name validation (no AWS access needed).
+"""
+
+import importlib.util
+import os
+import sys
+
+# s3drop-setup.py isn't importable by name because of the hyphen
+_SETUP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 's3drop-setup.py')
+_spec = importlib.util.spec_from_file_location('s3drop_setup', _SETUP_PATH)
+s3drop_setup = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(s3drop_setup)
+
+# (name, expected to be valid)
+CASES = [
+    ('my-drops', True),
+    ('abc', True),
+    ('a' * 63, True),
+    ('drops.2024-acme', True),
+    ('1stdrops', True),
+    ('ab', False),              # too short
+    ('a' * 64, False),          # too long
+    ('My-Drops', False),        # uppercase
+    ('-drops', False),          # must start with a letter or number
+    ('drops-', False),          # must end with a letter or number
+    ('drops.', False),
+    ('a..b', False),            # adjacent periods
+    ('my_drops', False),        # underscore
+    ('192.168.1.1', False),     # IP address
+    ('10.0.0.1', False),
+    ('192.168.1.1.drops', True),  # only a full IP address is rejected
+]
+
+
+def test_bucket_name_validation():
+    """Check every name in CASES against is_valid_drop_zone_name."""
+    failures = []
+    for name, expected in CASES:
+        if s3drop_setup.is_valid_drop_zone_name(name) != expected:
+            failures.append(name)
+            print(f"❌ {name!r}: expected {'valid' if expected else 'invalid'}")
+
+    assert not failures, f"Unexpected results for: {', '.join(failures)}"
+    print(f"✅ All {len(CASES)} drop zone name cases passed")
+
+
+if __name__ == "__main__":
+    print("S3Drop Drop Zone Name Validation Test")
+    print("=" * 50)
+
+    try:
+        test_bucket_name_validation()
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        sys.exit(1)
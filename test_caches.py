@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test script for S3Drop's region and share link caches (no AWS access needed).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import s3drop
+
+
+class SigningClient:
+    """Stands in for an S3 client; counts the links it signs."""
+
+    def __init__(self):
+        self.signed = 0
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        self.signed += 1
+        return f"https://{Params['Bucket']}.example/{Params['Key']}?n={self.signed}"
+
+
+def use_cache_dir(cache_dir):
+    """Point every s3drop cache at cache_dir."""
+    s3drop.CACHE_DIR = cache_dir
+    s3drop.URL_CACHE_PATH = os.path.join(cache_dir, 'urls.db')
+    s3drop.REGION_CACHE_PATH = os.path.join(cache_dir, 'regions.json')
+    s3drop._url_db = None
+
+
+def test_region_cache():
+    """Store, forget and survive a corrupt region cache."""
+    print("🧪 Testing region cache")
+
+    assert s3drop._load_regions() == {}, "a missing cache should read as empty"
+
+    s3drop._store_region('drops-eu', 'eu-west-1')
+    s3drop._store_region('drops-us', 'us-east-1')
+    assert s3drop._load_regions() == {'drops-eu': 'eu-west-1', 'drops-us': 'us-east-1'}
+
+    s3drop._forget_region('drops-eu')
+    s3drop._forget_region('never-cached')
+    assert s3drop._load_regions() == {'drops-us': 'us-east-1'}
+
+    with open(s3drop.REGION_CACHE_PATH, 'w') as f:
+        f.write('{not json')
+    assert s3drop._load_regions() == {}, "a corrupt cache should read as empty"
+
+    with open(s3drop.REGION_CACHE_PATH, 'w') as f:
+        f.write('["drops-us"]')
+    assert s3drop._load_regions() == {}, "a cache that isn't a dict should read as empty"
+    print("✅ Regions are stored, forgotten and unreadable caches ignored")
+
+
+def test_share_link_cache_key():
+    """Links must not be shared between signers, regions or check modes."""
+    print("🧪 Testing share link cache keys")
+
+    key = s3drop._share_link_cache_key
+    base = key('AKIA|us-east-1', 'drops', 'a.txt', 3600, True)
+    variants = [
+        key('AKIB|us-east-1', 'drops', 'a.txt', 3600, True),
+        key('AKIA|eu-west-1', 'drops', 'a.txt', 3600, True),
+        key('AKIA|us-east-1', 'other', 'a.txt', 3600, True),
+        key('AKIA|us-east-1', 'drops', 'b.txt', 3600, True),
+        key('AKIA|us-east-1', 'drops', 'a.txt', 7200, True),
+        key('AKIA|us-east-1', 'drops', 'a.txt', 3600, False),
+    ]
+    assert base == key('AKIA|us-east-1', 'drops', 'a.txt', 3600, True)
+    assert base not in variants and len(set(variants)) == len(variants)
+    print("✅ Cache keys differ for every signer, region, bucket, key, expiry and check mode")
+
+
+def test_share_link_expiry():
+    """Cached links are reused only while enough of their lifetime is left."""
+    print("🧪 Testing share link cache expiry")
+
+    now = int(time.time())
+    s3drop._store_share_links([
+        ('fresh', 'https://fresh', now + 3600),
+        ('stale', 'https://stale', now + 60),
+    ])
+    found = s3drop._load_share_links(['fresh', 'stale', 'missing'], now + 3000)
+    assert set(found) == {'fresh'}, f"unexpected cache hits: {sorted(found)}"
+    assert found['fresh'][0] == 'https://fresh'
+    assert int(found['fresh'][1].timestamp()) == now + 3600
+
+    # More keys than fit in one query
+    keys = [f"bulk-{i}" for i in range(1200)]
+    s3drop._store_share_links([(k, f"https://{k}", now + 3600) for k in keys])
+    assert len(s3drop._load_share_links(keys, now)) == len(keys)
+    print("✅ Stale links are skipped and large batches are loaded in full")
+
+
+def test_presign_many():
+    """A batch is signed once and then served from the cache."""
+    print("🧪 Testing batch presigning")
+
+    client = SigningClient()
+    keys = ['one.txt', 'two.txt', 'three.txt']
+    first = s3drop._presign_many(client, 'AKIA|us-east-1', 'drops', keys, 3600)
+    assert client.signed == 3, f"expected 3 signatures, got {client.signed}"
+    assert len({expiry for _, expiry in first.values()}) == 1, "a batch should share one expiry"
+
+    second = s3drop._presign_many(client, 'AKIA|us-east-1', 'drops', keys + ['four.txt'], 3600)
+    assert client.signed == 4, f"cached links were signed again ({client.signed} signatures)"
+    assert all(second[k] == first[k] for k in keys)
+
+    s3drop._presign_many(client, 'AKIA|eu-west-1', 'drops', keys, 3600)
+    assert client.signed == 7, "links signed for another region must not be reused"
+    print("✅ Batches reuse cached links and sign only the rest")
+
+
+if __name__ == "__main__":
+    print("S3Drop Cache Test")
+    print("=" * 50)
+
+    cache_dir = tempfile.mkdtemp(prefix='s3drop-cache-test-')
+    use_cache_dir(cache_dir)
+
+    try:
+        test_region_cache()
+        test_share_link_cache_key()
+        test_share_link_expiry()
+        test_presign_many()
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        sys.exit(1)
+    finally:
+        shutil.rmtree(cache_dir)
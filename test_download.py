@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test script for S3Drop's fetch (parallel byte-range downloads) against a
+stand-in S3 client (no AWS access needed, but botocore must be installed).
+"""
+
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from botocore.exceptions import ClientError
+
+from s3drop import S3Drop
+
+
+class Body:
+    """Streaming body that hands out its data in small chunks."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def iter_chunks(self, chunk_size):
+        for i in range(0, len(self._data), 3):
+            yield self._data[i:i + 3]
+
+
+class RangeClient:
+    """Serves one object, recording the ranges asked for."""
+
+    ETAG = '"abc123"'
+
+    def __init__(self, data, fail_at=None):
+        self.data = data
+        self.fail_at = fail_at
+        self.ranges = []
+        self._lock = threading.Lock()
+
+    def head_object(self, Bucket, Key):
+        return {'ContentLength': len(self.data), 'ETag': self.ETAG}
+
+    def get_object(self, Bucket, Key, Range, IfMatch):
+        assert IfMatch == self.ETAG, "parts must be pinned to the object's ETag"
+        start, end = map(int, re.fullmatch(r'bytes=(\d+)-(\d+)', Range).groups())
+        with self._lock:
+            self.ranges.append((start, end))
+        if start == self.fail_at:
+            raise ClientError({'Error': {'Code': 'PreconditionFailed', 'Message': 'changed'}}, 'GetObject')
+        return {'Body': Body(self.data[start:end + 1])}
+
+
+def make_drop(client):
+    """S3Drop instance around a stand-in client, without connecting to AWS."""
+    s3drop = S3Drop.__new__(S3Drop)
+    s3drop.bucket_name = 'test-drops'
+    s3drop.s3_client = client
+    return s3drop
+
+
+def fetch(work_dir, data, part_size, fail_at=None):
+    """Download data through a RangeClient and return (client, path, error)."""
+    client = RangeClient(data, fail_at)
+    path = os.path.join(work_dir, 'out.bin')
+    if os.path.exists(path):
+        os.remove(path)
+    try:
+        make_drop(client).download_file('file.bin', path, concurrency=4, part_size=part_size)
+    except ClientError as e:
+        return client, path, e
+    return client, path, None
+
+
+def test_range_splitting(work_dir):
+    """A file is split into part_size ranges and reassembled in order."""
+    print("🧪 Testing byte-range splitting")
+
+    data = bytes(range(256)) * 4 + b'tail'
+    client, path, _ = fetch(work_dir, data, part_size=100)
+
+    expected = [(start, min(start + 100, len(data)) - 1) for start in range(0, len(data), 100)]
+    assert sorted(client.ranges) == expected, f"unexpected ranges: {sorted(client.ranges)}"
+    with open(path, 'rb') as f:
+        assert f.read() == data, "downloaded file doesn't match"
+    print(f"✅ {len(expected)} ranges fetched and written in place")
+
+
+def test_edge_sizes(work_dir):
+    """Empty and exactly-one-part files take a single request, or none."""
+    print("🧪 Testing empty and single-part files")
+
+    client, path, _ = fetch(work_dir, b'', part_size=100)
+    assert client.ranges == [], "an empty file needs no GET"
+    assert os.path.getsize(path) == 0
+
+    data = b'x' * 100
+    client, path, _ = fetch(work_dir, data, part_size=100)
+    assert client.ranges == [(0, 99)], f"unexpected ranges: {client.ranges}"
+    with open(path, 'rb') as f:
+        assert f.read() == data
+    print("✅ Empty file created without a GET, part_size-sized file in one GET")
+
+
+def test_seek_write_fallback(work_dir):
+    """Without os.pwrite (Windows), parts are still written in the right place."""
+    print("🧪 Testing the seek + write fallback")
+
+    pwrite = getattr(os, 'pwrite', None)
+    if pwrite is not None:
+        del os.pwrite
+    try:
+        data = bytes(range(256)) * 4
+        _, path, _ = fetch(work_dir, data, part_size=100)
+    finally:
+        if pwrite is not None:
+            os.pwrite = pwrite
+    with open(path, 'rb') as f:
+        assert f.read() == data, "downloaded file doesn't match"
+    print("✅ Parts written in place without pwrite")
+
+
+def test_failure_cleanup(work_dir):
+    """A failed part leaves neither the file nor its temporary file behind."""
+    print("🧪 Testing cleanup after a failed part")
+
+    client, path, error = fetch(work_dir, b'y' * 1000, part_size=100, fail_at=300)
+    assert error is not None, "a failed part should fail the download"
+    leftovers = os.listdir(work_dir)
+    assert not leftovers, f"files left behind: {leftovers}"
+    print("✅ Failure raised and temporary file removed")
+
+
+if __name__ == "__main__":
+    print("S3Drop Fetch Test")
+    print("=" * 50)
+
+    work_dir = tempfile.mkdtemp(prefix='s3drop-fetch-test-')
+
+    try:
+        test_range_splitting(work_dir)
+        test_edge_sizes(work_dir)
+        test_seek_write_fallback(work_dir)
+        test_failure_cleanup(work_dir)
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        sys.exit(1)
+    finally:
+        shutil.rmtree(work_dir)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test script for S3Drop's drop-many command (requires AWS credentials).
+
+drop-many output is meant to be piped into other tools, so stdout must
+only ever contain one JSON object per line.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def run_drop_many(drop_zone, *args):
+    """Run drop-many and return the CompletedProcess."""
+    return subprocess.run(
+        ['python3', 's3drop.py', drop_zone, 'drop-many'] + list(args),
+        capture_output=True, text=True, timeout=120
+    )
+
+
+def parse_json_lines(stdout):
+    """Parse stdout as JSON lines, failing on anything that isn't JSON."""
+    results = []
+    for line in stdout.splitlines():
+        try:
+            results.append(json.loads(line))
+        except ValueError:
+            raise AssertionError(f"Non-JSON line on stdout: {line!r}")
+    return results
+
+
+def test_drop_many(drop_zone, work_dir):
+    """Upload a batch with a duplicate name and a missing file."""
+    print("🧪 Testing drop-many batch upload")
+
+    paths = []
+    for name in ('a', 'b'):
+        os.makedirs(os.path.join(work_dir, name))
+        path = os.path.join(work_dir, name, 'same.txt')
+        with open(path, 'w') as f:
+            f.write(f"duplicate name from {name}/")
+        paths.append(path)
+
+    good = os.path.join(work_dir, 's3drop_batch_test.txt')
+    with open(good, 'w') as f:
+        f.write("This is a test file for S3Drop drop-many.")
+    missing = os.path.join(work_dir, 'missing.txt')
+
+    result = run_drop_many(drop_zone, good, missing, *paths, '--share')
+    results = {r['path']: r for r in parse_json_lines(result.stdout)}
+
+    assert result.returncode == 1, f"expected exit code 1, got {result.returncode}"
+    assert len(results) == 4, f"expected 4 results, got {len(results)}"
+    assert results[good]['ok'] and results[good]['url'].startswith('https://')
+    assert not results[missing]['ok']
+    for path in paths:
+        assert not results[path]['ok'] and 'Duplicate' in results[path]['error']
+    print("✅ One JSON line per file, duplicates and missing files reported")
+
+    subprocess.run(['aws', 's3', 'rm', f's3://{drop_zone}/s3drop_batch_test.txt'],
+                   capture_output=True, text=True)
+
+
+def test_errors_stay_off_stdout(drop_zone, work_dir):
+    """A bad --expires must fail without printing anything to stdout."""
+    print("🧪 Testing drop-many error output")
+
+    path = os.path.join(work_dir, 'unused.txt')
+    with open(path, 'w') as f:
+        f.write("never uploaded")
+
+    result = run_drop_many(drop_zone, path, '--share', '--expires', 'soon')
+
+    assert result.returncode == 1, f"expected exit code 1, got {result.returncode}"
+    assert result.stdout == '', f"unexpected stdout: {result.stdout!r}"
+    assert 'Operation failed' in result.stderr
+    print("✅ Errors go to stderr, stdout stays empty")
+
+
+if __name__ == "__main__":
+    print("S3Drop drop-many Test")
+    print("=" * 50)
+
+    drop_zone = f"s3drop-test-{int(time.time())}"
+    work_dir = tempfile.mkdtemp(prefix='s3drop-test-')
+    print(f"🪣 Drop zone: {drop_zone}")
+
+    try:
+        test_drop_many(drop_zone, work_dir)
+        test_errors_stay_off_stdout(drop_zone, work_dir)
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        sys.exit(1)
+    finally:
+        shutil.rmtree(work_dir)
+
+    print(f"\n💡 Drop zone '{drop_zone}' left for your use")
@@ -7,8 +7,21 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from s3drop import S3Drop
 
+# One keep-alive session for the availability checks and the shortener
+# calls, so each host's TCP/TLS connection is set up once
+_SESSION = requests.Session()
+_SESSION.headers['User-Agent'] = 's3drop-test'
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4,
+                       max_retries=Retry(total=2, backoff_factor=0.3))
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
 def test_url_shortening_services():
     """Test all URL shortening services."""
     
@@ -36,7 +49,7 @@ def test_url_shortening_services():
     for service in services:
         print(f"🔧 Testing {service.upper()}...")
         try:
-            short_url = s3drop.shorten_url(test_url, service)
+            short_url = s3drop.shorten_url(test_url, service, session=_SESSION)
             if short_url != test_url:
                 results[service] = {
                     'success': True,
@@ -88,8 +101,6 @@ def test_service_availability():
     print("\n🌐 Testing Service Availability")
     print("=" * 40)
     
-    import requests
-    
     services = {
         'tinyurl': 'http://tinyurl.com',
         'isgd': 'https://is.gd',
@@ -99,7 +110,7 @@ def test_service_availability():
     
     for service, url in services.items():
         try:
-            response = requests.get(url, timeout=5)
+            response = _SESSION.get(url, timeout=5)
             if response.status_code == 200:
                 print(f"✅ {service.upper()}: Available")
             else:
@@ -135,4 +146,6 @@ if __name__ == "__main__":
         print("\n👋 Test cancelled by user")
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+    finally:
+        _SESSION.close()
\ No newline at end of file